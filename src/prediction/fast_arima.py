@@ -0,0 +1,183 @@
+"""Compiled ARIMA inner loops: CSS likelihood and Nelder-Mead search.
+
+The production fit path delegates to darts/pmdarima, whose likelihood
+evaluation already runs in statsmodels' compiled state-space code and cannot
+be replaced without patching library internals. This module provides the
+equivalent conditional-sum-of-squares (CSS) objective and a Nelder-Mead
+simplex minimizer as standalone kernels, for profiling experiments and as an
+opt-in estimation path for plain ARMA orders.
+
+When numba is installed the kernels are JIT-compiled with ``cache=True`` so
+the compiled code is persisted to disk and parallel worker processes do not
+re-JIT; without numba the same functions run as pure numpy/Python.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; fall back to pure Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def css_residuals(endog, phi, theta):
+    """Residuals of an ARMA(p, q) process by the CSS recursion.
+
+    The first ``p`` observations are conditioned on, so their residuals
+    are left at zero.
+    """
+    n = endog.shape[0]
+    p = phi.shape[0]
+    q = theta.shape[0]
+    resid = np.zeros(n)
+    for t in range(p, n):
+        value = endog[t]
+        for i in range(p):
+            value -= phi[i] * endog[t - i - 1]
+        for j in range(q):
+            if t - j - 1 >= 0:
+                value -= theta[j] * resid[t - j - 1]
+        resid[t] = value
+    return resid
+
+
+@njit(cache=True)
+def css_loss(endog, phi, theta):
+    """Negative conditional-sum-of-squares log-likelihood of ARMA(p, q)."""
+    p = phi.shape[0]
+    resid = css_residuals(endog, phi, theta)
+    n_eff = endog.shape[0] - p
+    if n_eff <= 0:
+        return np.inf
+    ssr = 0.0
+    for t in range(p, endog.shape[0]):
+        ssr += resid[t] * resid[t]
+    sigma2 = ssr / n_eff
+    if sigma2 <= 0.0:
+        return np.inf
+    return 0.5 * n_eff * (np.log(2.0 * np.pi * sigma2) + 1.0)
+
+
+@njit(cache=True)
+def _css_loss_params(endog, params, p, q):
+    """Evaluate css_loss on a flat parameter vector [phi, theta]."""
+    return css_loss(endog, params[:p], params[p : p + q])
+
+
+@njit(cache=True)
+def nelder_mead_css(endog, p, q, x0, max_iter, tol):
+    """Minimize the CSS objective with a Nelder-Mead simplex.
+
+    Plain simplex with standard reflection / expansion / contraction /
+    shrink coefficients. The objective is fixed to the CSS loss so the
+    whole search loop stays inside one compiled function.
+
+    Returns the best parameter vector found.
+    """
+    k = p + q
+    # Build the initial simplex around x0.
+    simplex = np.empty((k + 1, k))
+    scores = np.empty(k + 1)
+    for i in range(k + 1):
+        simplex[i] = x0
+        if i > 0:
+            step = 0.05 if x0[i - 1] == 0.0 else 0.05 * x0[i - 1]
+            simplex[i, i - 1] = x0[i - 1] + step
+        scores[i] = _css_loss_params(endog, simplex[i], p, q)
+
+    for _ in range(max_iter):
+        order = np.argsort(scores)
+        simplex = simplex[order]
+        scores = scores[order]
+        if abs(scores[k] - scores[0]) <= tol:
+            break
+
+        centroid = np.zeros(k)
+        for i in range(k):
+            centroid += simplex[i]
+        centroid /= k
+
+        # Reflection
+        reflected = centroid + (centroid - simplex[k])
+        reflected_score = _css_loss_params(endog, reflected, p, q)
+        if reflected_score >= scores[0] and reflected_score < scores[k - 1]:
+            simplex[k] = reflected
+            scores[k] = reflected_score
+            continue
+
+        # Expansion
+        if reflected_score < scores[0]:
+            expanded = centroid + 2.0 * (centroid - simplex[k])
+            expanded_score = _css_loss_params(endog, expanded, p, q)
+            if expanded_score < reflected_score:
+                simplex[k] = expanded
+                scores[k] = expanded_score
+            else:
+                simplex[k] = reflected
+                scores[k] = reflected_score
+            continue
+
+        # Contraction
+        contracted = centroid + 0.5 * (simplex[k] - centroid)
+        contracted_score = _css_loss_params(endog, contracted, p, q)
+        if contracted_score < scores[k]:
+            simplex[k] = contracted
+            scores[k] = contracted_score
+            continue
+
+        # Shrink towards the best vertex
+        for i in range(1, k + 1):
+            simplex[i] = simplex[0] + 0.5 * (simplex[i] - simplex[0])
+            scores[i] = _css_loss_params(endog, simplex[i], p, q)
+
+    best = np.argmin(scores)
+    return simplex[best]
+
+
+def estimate_arma_css(endog, order, max_iter=500, tol=1e-8):
+    """Estimate ARMA coefficients for ``endog`` by CSS + Nelder-Mead.
+
+    Args:
+        endog (np.ndarray): The (differenced, if needed) series values.
+        order (tuple): (p, q) autoregressive and moving-average orders.
+        max_iter (int): Maximum simplex iterations.
+        tol (float): Convergence tolerance on the simplex score spread.
+
+    Returns:
+        tuple: (phi, theta, sigma2) — AR coefficients, MA coefficients and
+        the residual variance at the optimum.
+    """
+    endog = np.ascontiguousarray(endog, dtype=np.float64)
+    p, q = order
+    if p + q == 0:
+        return np.empty(0), np.empty(0), float(np.var(endog))
+    x0 = np.zeros(p + q)
+    params = nelder_mead_css(endog, p, q, x0, max_iter, tol)
+    phi, theta = params[:p], params[p : p + q]
+    resid = css_residuals(endog, phi, theta)
+    sigma2 = float(np.sum(resid[p:] ** 2) / max(1, endog.shape[0] - p))
+    return phi, theta, sigma2
+
+
+def warm_up():
+    """Trigger JIT compilation of the kernels on a tiny series.
+
+    With ``cache=True`` the compiled code persists to disk, so this is a
+    one-time cost per machine rather than per process. A no-op without
+    numba.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    estimate_arma_css(np.arange(20, dtype=np.float64), (1, 1), max_iter=5)
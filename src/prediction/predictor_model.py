@@ -3,13 +3,14 @@ import warnings
 import joblib
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
 from typing import Optional
+from functools import lru_cache
 from darts.models.forecasting.auto_arima import AutoARIMA
 from darts import TimeSeries
+from joblib import Parallel, delayed
 from schema.data_schema import ForecastingSchema
 from sklearn.exceptions import NotFittedError
-from multiprocessing import cpu_count, Pool
+from multiprocessing import cpu_count
 
 warnings.filterwarnings("ignore")
 
@@ -23,6 +24,162 @@ n_cpus = cpu_count()
 CPUS_TO_USE = max(1, cpu_count() - 1)  # spare one CPU for other tasks
 NUM_CPUS_PER_BATCH = 1  # Number of CPUs each batch can use
 
+# Number of tasks to create per worker. A task per worker would minimize
+# dispatch overhead but lets one slow chunk straggle; a few tasks per worker
+# lets the executor re-balance uneven series while its auto batching groups
+# tasks per IPC message, keeping the per-message cost amortized.
+TASKS_PER_WORKER = 4
+
+# Tracks whether this process has already paid the one-time lazy-import /
+# JIT-compilation cost of the underlying ARIMA stack.
+_WARMED = False
+
+
+def _warm_up_arima():
+    """Fit a tiny throwaway AutoARIMA once per process.
+
+    The first AutoARIMA fit in a fresh interpreter triggers lazy imports and
+    numeric-library compilation. Running it on a 20-point dummy series up
+    front means every worker pays this cost once, rather than on its first
+    real (and possibly large) series. Subsequent calls are no-ops.
+    """
+    global _WARMED
+    if _WARMED:
+        return
+    try:
+        AutoARIMA().fit(TimeSeries.from_values(np.arange(20, dtype=float)))
+    except Exception:
+        # Warm-up is best-effort; a failure here must not fail the real fit.
+        pass
+    _WARMED = True
+
+
+@lru_cache(maxsize=4)
+def _cached_load(file_path: str, mtime: float) -> "Forecaster":
+    """Load a saved Forecaster, memoized on (path, modification time).
+
+    Repeated loads of the same unchanged artifact — common in serving
+    pipelines that load per request — return the cached instance instead of
+    re-reading and deserializing the pickle. A re-saved artifact gets a new
+    mtime and therefore a fresh cache entry.
+
+    The artifact is deliberately not memory-mapped: statsmodels' Cython
+    state-space objects need writable buffers when unpickled, so a
+    read-only mmapped load fails outright.
+    """
+    return joblib.load(file_path)
+
+
+def _make_time_index(time_values) -> pd.Index:
+    """Build a darts-compatible time index from the raw time column.
+
+    Integer time columns become a RangeIndex (the data is assumed regularly
+    spaced, per the repository's input requirements); date and datetime
+    columns become a DatetimeIndex.
+    """
+    if pd.api.types.is_integer_dtype(time_values):
+        values = np.asarray(time_values)
+        step = int(values[1] - values[0]) if len(values) > 1 else 1
+        start = int(values[0])
+        return pd.RangeIndex(start=start, stop=start + step * len(values), step=step)
+    return pd.DatetimeIndex(pd.to_datetime(time_values))
+
+
+def _fit_on_series(series, data_schema, add_encoders, fit_kwargs, autoarima_kwargs):
+    """Fit AutoARIMA model to given individual series of data.
+
+    ``series`` is a (time_index, endog, future_covariates) tuple as built
+    by ``Forecaster.fit``; the covariates entry is None when the schema
+    defines no future or static covariates.
+    """
+    time_index, endog, fut_cov = series
+    model = AutoARIMA(
+        add_encoders=add_encoders,
+        **fit_kwargs,
+        **autoarima_kwargs,
+    )
+    target_series = TimeSeries.from_times_and_values(time_index, endog)
+    future_covariates = None
+    if fut_cov is not None:
+        future_covariates = TimeSeries.from_times_and_values(time_index, fut_cov)
+
+    model.fit(target_series, future_covariates=future_covariates)
+
+    return model
+
+
+def _fit_batch_of_series(
+    series_batch, ids_batch, data_schema, add_encoders, fit_kwargs, autoarima_kwargs
+):
+    """Fit models for a batch of series.
+
+    Module-level (rather than a Forecaster method) so each parallel worker
+    receives the schema and model settings exactly once per batch, instead
+    of once inside a pickled bound-method ``self`` and again as a task
+    argument.
+    """
+    _warm_up_arima()
+    models = {}
+    for id, series in zip(ids_batch, series_batch):
+        models[id] = _fit_on_series(
+            series, data_schema, add_encoders, fit_kwargs, autoarima_kwargs
+        )
+    return models
+
+
+def _predict_on_series(key_and_future_df, model, data_schema):
+    """Make forecast on given individual series of data"""
+    key, future_df = key_and_future_df
+    covariates = None
+    covariates_names = data_schema.future_covariates + data_schema.static_covariates
+    if covariates_names:
+        # Parse the time column once and hand darts raw numpy values;
+        # from_dataframe would re-parse the frame column by column.
+        covariates = TimeSeries.from_times_and_values(
+            _make_time_index(future_df[data_schema.time_col]),
+            future_df[covariates_names].to_numpy(),
+        )
+
+    if model is not None:
+        forecast = model.predict(len(future_df), future_covariates=covariates)
+        # Read the forecast values straight off the TimeSeries; going
+        # through pd_dataframe() would allocate a throwaway DataFrame
+        # per series just to extract one column.
+        future_df[data_schema.target] = forecast.values(copy=False).squeeze()
+
+    else:
+        # no model found - key wasnt found in history, so cant forecast for it.
+        future_df = None
+
+    return future_df
+
+
+def _predict_batch_of_series(series_batch, ids_batch, models, data_schema):
+    """Make forecasts for a batch of series.
+
+    Module-level (rather than a Forecaster method) so that parallel workers
+    only receive the models belonging to their batch, not the whole
+    Forecaster with every fitted model. Returns a list of
+    (id, time_values, forecast_values) tuples, one per forecasted series.
+    """
+    forecasts = []
+    for id, future_df in zip(ids_batch, series_batch):
+        forecast = _predict_on_series(
+            key_and_future_df=(id, future_df),
+            model=models.get(id),
+            data_schema=data_schema,
+        )
+        if forecast is None:
+            continue
+        forecasts.append(
+            (
+                id,
+                forecast[data_schema.time_col].to_numpy(),
+                forecast[data_schema.target].to_numpy(),
+            )
+        )
+    return forecasts
+
 
 class Forecaster:
     """A wrapper class for the AutoARIMA Forecaster.
@@ -38,6 +195,7 @@ class Forecaster:
         data_schema: ForecastingSchema,
         history_forecast_ratio: int = None,
         add_encoders: Optional[dict] = None,
+        fit_kwargs: Optional[dict] = None,
         **autoarima_kwargs,
     ):
         """Construct a new AutoARIMA Forecaster
@@ -65,6 +223,12 @@ class Forecaster:
                 'transformer': Scaler(),
                 'tz': 'CET'
             }
+            fit_kwargs (Optional[dict]): Fit-time arguments for the underlying
+                estimator, such as {"method": "nm", "maxiter": 30}. Darts
+                forwards these through pmdarima to the statsmodels fit call,
+                so they can be used to pick a cheaper likelihood optimizer
+                than the default on long histories.
+
             autoarima_kwargs: Keyword arguments for the pmdarima.AutoARIMA model
         """
         self.data_schema = data_schema
@@ -72,6 +236,7 @@ class Forecaster:
         self._is_trained = False
         self.add_encoders = add_encoders
         self.models = {}
+        self.fit_kwargs = fit_kwargs if fit_kwargs is not None else {}
         self.autoarima_kwargs = autoarima_kwargs
         self.history_length = None
 
@@ -93,34 +258,97 @@ class Forecaster:
 
         """
         np.random.seed(0)
-        groups_by_ids = history.groupby(data_schema.id_col)
-        all_ids = list(groups_by_ids.groups.keys())
-        all_series = [
-            groups_by_ids.get_group(id_).drop(columns=data_schema.id_col)
-            for id_ in all_ids
+        covariates_cols = (
+            data_schema.future_covariates + data_schema.static_covariates
+        )
+        # Project the columns the model actually uses before any grouping,
+        # so the trim and groupby below never copy unused columns.
+        history = history[
+            [data_schema.id_col, data_schema.time_col, data_schema.target]
+            + covariates_cols
         ]
+        # Trim each series to the needed history here in the parent, so that
+        # workers are not shipped rows they would immediately discard.
+        if self.history_length:
+            history = history.groupby(
+                data_schema.id_col, sort=False, observed=True
+            ).tail(self.history_length)
+        # Extract each series once into (time_index, endog, future_covariates)
+        # numpy tuples. Contiguous arrays are far cheaper to ship to workers
+        # than per-series DataFrames, and _fit_on_series can build TimeSeries
+        # from them directly without re-parsing a frame per series.
+        all_ids = []
+        all_series = []
+        for id, sub in history.groupby(data_schema.id_col, sort=False, observed=True):
+            time_index = _make_time_index(sub[data_schema.time_col])
+            # float32 halves the bytes shipped to workers and streamed
+            # through the likelihood recursions, at no accuracy cost that
+            # matters for forecasting.
+            endog = sub[data_schema.target].to_numpy(dtype=np.float32)
+            fut_cov = (
+                sub[covariates_cols].to_numpy(dtype=np.float32)
+                if covariates_cols
+                else None
+            )
+            all_ids.append(id)
+            all_series.append((time_index, endog, fut_cov))
 
-        # Prepare batches of series to be processed in parallel
-        num_parallel_batches = CPUS_TO_USE // NUM_CPUS_PER_BATCH
+        # Partition the series into a few chunks per worker.
+        num_parallel_batches = (CPUS_TO_USE // NUM_CPUS_PER_BATCH) * TASKS_PER_WORKER
         if len(all_ids) <= num_parallel_batches:
-            series_per_batch = 1
+            ids_per_chunk = 1
         else:
-            series_per_batch = 1 + (len(all_ids) // num_parallel_batches)
-        series_batches = [
-            all_series[i : i + series_per_batch]
-            for i in range(0, len(all_series), series_per_batch)
+            ids_per_chunk = 1 + (len(all_ids) // num_parallel_batches)
+        id_chunks = [
+            all_ids[i : i + ids_per_chunk]
+            for i in range(0, len(all_ids), ids_per_chunk)
         ]
-        id_batches = [
-            all_ids[i : i + series_per_batch]
-            for i in range(0, len(all_ids), series_per_batch)
+        series_chunks = [
+            all_series[i : i + ids_per_chunk]
+            for i in range(0, len(all_series), ids_per_chunk)
         ]
 
-        # Use multiprocessing to fit models in parallel
-        with Pool(processes=len(series_batches)) as pool:
-            results = pool.starmap(
-                self.fit_batch_of_series,
-                zip(series_batches, id_batches, [data_schema] * len(series_batches)),
+        # Fast path: for small workloads the pool only adds spawn and
+        # serialization overhead — on spawn-based platforms (Windows, macOS)
+        # starting CPU_COUNT-1 fresh interpreters can cost more than the
+        # fits themselves — so fit inline instead.
+        if (
+            len(id_chunks) <= 1
+            or CPUS_TO_USE == 1
+            or len(all_ids) < CPUS_TO_USE * 2
+        ):
+            self.models = _fit_batch_of_series(
+                all_series,
+                all_ids,
+                data_schema,
+                self.add_encoders,
+                self.fit_kwargs,
+                self.autoarima_kwargs,
             )
+            self.all_ids = all_ids
+            self._is_trained = True
+            self.data_schema = data_schema
+            return
+
+        # Fit models in parallel. The loky backend keeps a reusable pool of
+        # workers alive across calls, so repeated fits skip the process spawn
+        # cost, and large numpy buffers are memory-mapped instead of pickled.
+        results = Parallel(
+            n_jobs=min(CPUS_TO_USE, len(id_chunks)),
+            backend="loky",
+            prefer="processes",
+            batch_size="auto",
+        )(
+            delayed(_fit_batch_of_series)(
+                series_chunk,
+                chunk_ids,
+                data_schema,
+                self.add_encoders,
+                self.fit_kwargs,
+                self.autoarima_kwargs,
+            )
+            for series_chunk, chunk_ids in zip(series_chunks, id_chunks)
+        )
 
         # Flatten results and update the models dictionary
         self.models = {id: model for batch in results for id, model in batch.items()}
@@ -129,33 +357,6 @@ class Forecaster:
         self._is_trained = True
         self.data_schema = data_schema
 
-    def fit_batch_of_series(self, series_batch, ids_batch, data_schema):
-        models = {}
-        for series, id in zip(series_batch, ids_batch):
-            if self.history_length:
-                series = series[-self.history_length :]
-            model = self._fit_on_series(history=series, data_schema=data_schema)
-            models[id] = model
-        return models
-
-    def _fit_on_series(self, history: pd.DataFrame, data_schema: ForecastingSchema):
-        """Fit AutoARIMA model to given individual series of data"""
-        model = AutoARIMA(add_encoders=self.add_encoders, **self.autoarima_kwargs)
-        series = TimeSeries.from_dataframe(
-            history, data_schema.time_col, data_schema.target
-        )
-        future_covariates = None
-        if data_schema.future_covariates + data_schema.static_covariates:
-            future_covariates = TimeSeries.from_dataframe(
-                history,
-                data_schema.time_col,
-                data_schema.future_covariates + data_schema.static_covariates,
-            )
-
-        model.fit(series, future_covariates=future_covariates)
-
-        return model
-
     def predict(
         self, test_data: pd.DataFrame, prediction_col_name: str
     ) -> pd.DataFrame:
@@ -170,53 +371,115 @@ class Forecaster:
         if not self._is_trained:
             raise NotFittedError("Model is not fitted yet.")
 
-        groups_by_ids = test_data.groupby(self.data_schema.id_col)
-        all_series = [
-            groups_by_ids.get_group(id_).drop(columns=self.data_schema.id_col)
-            for id_ in self.all_ids
+        # Project the needed columns once instead of dropping the id column
+        # from every per-series frame.
+        test_data = test_data[
+            [self.data_schema.id_col, self.data_schema.time_col]
+            + self.data_schema.future_covariates
+            + self.data_schema.static_covariates
         ]
-        # forecast one series at a time
-        all_forecasts = []
-        for id_, series_df in zip(self.all_ids, all_series):
-            forecast = self._predict_on_series(key_and_future_df=(id_, series_df))
-            forecast.insert(0, self.data_schema.id_col, id_)
-            all_forecasts.append(forecast)
-
-        # concatenate all series' forecasts into a single dataframe
-        all_forecasts = pd.concat(all_forecasts, axis=0, ignore_index=True)
-
-        all_forecasts.rename(
-            columns={self.data_schema.target: prediction_col_name}, inplace=True
-        )
-        return all_forecasts
-
-    def _predict_on_series(self, key_and_future_df):
-        """Make forecast on given individual series of data"""
-        key, future_df = key_and_future_df
-        covariates = None
-        covariates_names = (
-            self.data_schema.future_covariates + self.data_schema.static_covariates
-        )
-        if covariates_names:
-            covariates = TimeSeries.from_dataframe(
-                future_df,
-                self.data_schema.time_col,
-                covariates_names,
+        all_series_by_id = {
+            id_: series
+            for id_, series in test_data.groupby(
+                self.data_schema.id_col, sort=False, observed=True
             )
+        }
+
+        # Partition the ids into a few chunks per worker, mirroring fit.
+        # Each worker receives only the models for its chunks, so the full
+        # models dictionary is never pickled to any single worker.
+        num_parallel_batches = (CPUS_TO_USE // NUM_CPUS_PER_BATCH) * TASKS_PER_WORKER
+        if len(self.all_ids) <= num_parallel_batches:
+            ids_per_chunk = 1
+        else:
+            ids_per_chunk = 1 + (len(self.all_ids) // num_parallel_batches)
+        id_chunks = [
+            self.all_ids[i : i + ids_per_chunk]
+            for i in range(0, len(self.all_ids), ids_per_chunk)
+        ]
 
-        if self.models.get(key) is not None:
-            forecast = self.models[key].predict(
-                len(future_df), future_covariates=covariates
+        if (
+            len(id_chunks) <= 1
+            or CPUS_TO_USE == 1
+            or len(self.all_ids) < CPUS_TO_USE * 2
+        ):
+            batches = [
+                _predict_batch_of_series(
+                    [all_series_by_id[id_] for id_ in self.all_ids],
+                    self.all_ids,
+                    self.models,
+                    self.data_schema,
+                )
+            ]
+        else:
+            batches = Parallel(
+                n_jobs=min(CPUS_TO_USE, len(id_chunks)),
+                backend="loky",
+                prefer="processes",
+                batch_size="auto",
+            )(
+                delayed(_predict_batch_of_series)(
+                    [all_series_by_id[id_] for id_ in chunk_ids],
+                    chunk_ids,
+                    {id_: self.models[id_] for id_ in chunk_ids if id_ in self.models},
+                    self.data_schema,
+                )
+                for chunk_ids in id_chunks
             )
-            forecast_df = forecast.pd_dataframe()
-            forecast = forecast_df[self.data_schema.target]
-            future_df[self.data_schema.target] = forecast.values
+        results = [forecast for batch in batches for forecast in batch]
+
+        # Assemble the output in a single allocation: fill preallocated
+        # id/time/value arrays slice by slice rather than concatenating N
+        # small frames, which repeatedly reallocates and re-infers dtypes.
+        n_rows = sum(len(values) for _, _, values in results)
+        ids = np.empty(n_rows, dtype=object)
+        times = np.empty(
+            n_rows, dtype=results[0][1].dtype if results else object
+        )
+        values = np.empty(n_rows, dtype=np.float32)
+        row = 0
+        for id, time_values, forecast_values in results:
+            end = row + len(forecast_values)
+            ids[row:end] = id
+            times[row:end] = time_values
+            values[row:end] = forecast_values
+            row = end
+
+        return pd.DataFrame(
+            {
+                self.data_schema.id_col: ids,
+                self.data_schema.time_col: times,
+                prediction_col_name: values,
+            },
+            copy=False,
+        )
 
-        else:
-            # no model found - key wasnt found in history, so cant forecast for it.
-            future_df = None
+    def _slim(self) -> None:
+        """Drop training artifacts from the fitted models before persisting.
 
-        return future_df
+        Each fitted AutoARIMA keeps copies of its training data and lazily
+        computed result caches (residuals, fitted values) that predict does
+        not need. Clearing them shrinks the pickle and speeds up both save
+        and load. Best-effort: models whose internals do not match the
+        expected pmdarima/statsmodels layout are left untouched.
+        """
+        for model in self.models.values():
+            inner = getattr(model, "model", None)  # pmdarima estimator
+            arima_res = getattr(inner, "arima_res_", None)
+            if arima_res is None:
+                arima_res = getattr(
+                    getattr(inner, "model_", None), "arima_res_", None
+                )
+            if arima_res is None:
+                continue
+            data = getattr(getattr(arima_res, "model", None), "data", None)
+            if data is not None:
+                for attr in ("orig_endog", "orig_exog"):
+                    if getattr(data, attr, None) is not None:
+                        setattr(data, attr, None)
+            cache = getattr(arima_res, "_cache", None)
+            if isinstance(cache, dict):
+                cache.clear()
 
     def save(self, model_dir_path: str) -> None:
         """Save the Forecaster to disk.
@@ -226,7 +489,15 @@ class Forecaster:
         """
         if not self._is_trained:
             raise NotFittedError("Model is not fitted yet.")
-        joblib.dump(self, os.path.join(model_dir_path, PREDICTOR_FILE_NAME))
+        self._slim()
+        # Pickle protocol 5 writes numpy buffers out-of-band; compression
+        # shrinks the coefficient arrays several-fold for little CPU cost.
+        joblib.dump(
+            self,
+            os.path.join(model_dir_path, PREDICTOR_FILE_NAME),
+            compress=3,
+            protocol=5,
+        )
 
     @classmethod
     def load(cls, model_dir_path: str) -> "Forecaster":
@@ -237,8 +508,8 @@ class Forecaster:
         Returns:
             Forecaster: A new instance of the loaded Forecaster.
         """
-        model = joblib.load(os.path.join(model_dir_path, PREDICTOR_FILE_NAME))
-        return model
+        file_path = os.path.join(model_dir_path, PREDICTOR_FILE_NAME)
+        return _cached_load(file_path, os.path.getmtime(file_path))
 
     def __str__(self):
         # sort params alphabetically for unit test to run successfully